@@ -1,8 +1,46 @@
 import logging
+import os
+
+# Logger configured by setup_logging, shared by all the calls
+_logger = None
+_formatter = logging.Formatter("%(message)s")
 
 
 # Setup logging
 def setup_logging(level=logging.INFO, log_filename="game_logs.log"):
+    """
+    Configure the logger of the package, printing to the console and to a file.
+
+    The first call adds the handlers and logs the welcome banner. Later calls
+    only update the level (e.g., mute logs for statistics) and, when
+    log_filename differs from the current one, close the current log file and
+    write to the new one instead. The banner is not logged again.
+
+    Parameters:
+        level (int): The logging level of the logger and of its handlers.
+        log_filename (str): The file the logs are written to.
+
+    Returns:
+        logging.Logger: The logger of the package.
+    """
+    global _logger
+
+    if _logger is not None:
+        _logger.setLevel(level)
+        log_path = os.path.abspath(log_filename)
+        for handler in list(_logger.handlers):
+            if (
+                isinstance(handler, logging.FileHandler)
+                and handler.baseFilename != log_path
+            ):
+                _logger.removeHandler(handler)
+                handler.close()
+                handler = logging.FileHandler(log_filename, delay=True)
+                handler.setFormatter(_formatter)
+                _logger.addHandler(handler)
+            handler.setLevel(level)
+        return _logger
+
     logger = logging.getLogger(__name__)
     logger.setLevel(level)
 
@@ -13,14 +51,13 @@ def setup_logging(level=logging.INFO, log_filename="game_logs.log"):
         ch = logging.StreamHandler()
         ch.setLevel(level)
 
-        # File handler
-        fh = logging.FileHandler(log_filename)
+        # File handler, the file is only opened when the first log is emitted
+        fh = logging.FileHandler(log_filename, delay=True)
         fh.setLevel(level)
 
         # Formatter
-        formatter = logging.Formatter("%(message)s")
-        ch.setFormatter(formatter)
-        fh.setFormatter(formatter)
+        ch.setFormatter(_formatter)
+        fh.setFormatter(_formatter)
 
         # Adding handlers to logger
         logger.addHandler(ch)
@@ -40,19 +77,104 @@ def setup_logging(level=logging.INFO, log_filename="game_logs.log"):
         f"#############################################################################################"
     )
 
+    _logger = logger
     return logger
 
 
-from .entity import *
-from .attributes import *
-from .damages import *
-from .modifiers import *
-from .items import *
-from .actors import *
-from .traits import *
-from .weapon_styles import *
-from .actions import *
-from .combat import *
-from .spells import *
-from .combat_strategies import *
-from .targeting_strategies import *
+from .entity import Entity
+from .attributes import Attributes, actor_attributes, hero_attributes
+from .damages import (
+    DamageType,
+    create_damage_class,
+    Physical,
+    Mystical,
+    Bludgeoning,
+    Cold,
+    Corrosion,
+    Fire,
+    Lightning,
+    Piercing,
+    Poison,
+    Slashing,
+    Psychic,
+    Radiant,
+    Sonic,
+    Umbral,
+    Damage,
+)
+from .modifiers import DamageModifier, Resistance, Vulnerability, ModifierManager
+from .items import (
+    Item,
+    ItemManager,
+    Armor,
+    Shield,
+    Weapon,
+    MeleeWeapon,
+    RangeWeapon,
+    create_weapon_class,
+    Axe,
+    Sword,
+    Bow,
+    Chained,
+    Crossbow,
+    Fist,
+    Hammer,
+    Pick,
+    Spear,
+    Staff,
+    Whip,
+)
+from .actors import Actor
+from .traits import Trait, TraitsManager
+from .weapon_styles import (
+    WeaponStyle,
+    Axe_style,
+    Bow_style,
+    Chained_style,
+    Crossbow_style,
+    Fist_style,
+    Hammer_style,
+    Pick_style,
+    Spear_style,
+    Staff_style,
+    Sword_style,
+    Whip_style,
+)
+from .actions import (
+    Action,
+    GainAdvantage,
+    Attack,
+    InflictDamage,
+    Target,
+    MoveToTarget,
+    Disengage,
+    Dodge,
+    Full_Dodge,
+    Grapple,
+    Help,
+    ImposeTrait,
+    ImposeSavingThrow,
+    CompositeAction,
+)
+from .combat import CombatManager, run_simulations, plot_simulation_results
+from .spells import Spell, CastSpell
+from .combat_strategies import (
+    CombatStrategy,
+    FullAttackStrategy,
+    DefaultStrategy,
+    DefaultDodgeStrategy,
+    is_ally_nearby,
+    HelpAllyStrategy,
+    attack_action,
+    help_action,
+    full_dodge_action,
+    gain_advantage_action,
+)
+from .targeting_strategies import (
+    TargetingStrategy,
+    TargetWeakestStrategy,
+    TargetHealthiestStrategy,
+    RandomTargetStrategy,
+    move_to_target_action,
+    target_action,
+)
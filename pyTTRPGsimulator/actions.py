@@ -1,67 +1,242 @@
 import logging
-from abc import ABC, abstractmethod
-from typing import List, Optional, TYPE_CHECKING
-import random
+from functools import partial
+from typing import Callable, List, Optional, Tuple, TYPE_CHECKING
 
 from .damages import Damage
+from .dice import roll, roll_many
 from .traits import Trait
 
 if TYPE_CHECKING:
     from .actors import Actor
 
+__all__ = [
+    "Action",
+    "GainAdvantage",
+    "Attack",
+    "InflictDamage",
+    "Target",
+    "MoveToTarget",
+    "Disengage",
+    "Dodge",
+    "Full_Dodge",
+    "Grapple",
+    "Help",
+    "ImposeTrait",
+    "ImposeSavingThrow",
+    "CompositeAction",
+]
+
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
-class Action(ABC):
+def _no_costs(actor: "Actor") -> bool:
+    """
+    Cost check of the actions that cost nothing: they can always be performed.
+    """
+    return True
+
+
+def _pay_action_points(action_points_cost: int, actor: "Actor") -> bool:
+    """
+    Cost check of the actions that only cost action points, which is most of them:
+    only the action points are read and updated.
+
+    Parameters:
+        action_points_cost (int): The number of action points the action costs.
+        actor (Actor): The actor performing the action.
+
+    Returns:
+        bool: True if the actor has enough points to perform the action, False otherwise.
+    """
+    action_points = actor.current_action_points
+    if action_points < action_points_cost:
+        logger.warning(
+            f"{actor.name} does not have enough action points to perform this action."
+        )
+        return False
+    actor.current_action_points = action_points - action_points_cost
+    return True
+
+
+def _pay_costs(
+    action_points_cost: int,
+    mana_points_cost: int,
+    stamina_points_cost: int,
+    actor: "Actor",
+) -> bool:
+    """
+    Deducts action costs from the actor if they have enough points.
+
+    Parameters:
+        action_points_cost (int): The number of action points the action costs.
+        mana_points_cost (int): The number of mana points the action costs.
+        stamina_points_cost (int): The number of stamina points the action costs.
+        actor (Actor): The actor performing the action.
+
+    Returns:
+        bool: True if the actor has enough points to perform the action, False otherwise.
+    """
+    action_points = actor.current_action_points
+    mana_points = actor.current_mana_points
+    stamina_points = actor.current_stamina_points
+
+    if (
+        action_points >= action_points_cost
+        and mana_points >= mana_points_cost
+        and stamina_points >= stamina_points_cost
+    ):
+        actor.current_action_points = action_points - action_points_cost
+        actor.current_mana_points = mana_points - mana_points_cost
+        actor.current_stamina_points = stamina_points - stamina_points_cost
+        return True
+
+    if action_points < action_points_cost:
+        missing = "action"
+    elif mana_points < mana_points_cost:
+        missing = "mana"
+    else:
+        missing = "stamina"
+    logger.warning(
+        f"{actor.name} does not have enough {missing} points to perform this action."
+    )
+    return False
+
+
+def _execute_methods(actions: Tuple["Action", ...]) -> Tuple[Callable, ...]:
+    """
+    Looks up the bound execute methods of actions, once when they are set.
+
+    Parameters:
+        actions (Tuple[Action, ...]): The actions to execute.
+
+    Returns:
+        Tuple[Callable, ...]: The bound execute methods of the actions.
+
+    Raises:
+        TypeError: If one of the actions is not an Action (e.g., a Trait, which
+            should be wrapped in an ImposeTrait action).
+    """
+    for action in actions:
+        if not isinstance(action, Action):
+            raise TypeError(
+                f"Expected Action instances, got {type(action).__name__}: {action!r}"
+            )
+    return tuple(action.execute for action in actions)
+
+
+def _hit_damage_bonus(
+    margin: int,
+    is_critical_hit: bool,
+    hit_damage: int,
+    heavy_hit_damage: int,
+    brutal_hit_damage: int,
+    critical_hit_damage: int,
+) -> Tuple[bool, int, int]:
+    """
+    Computes the damage bonus of a hit from how much it beats the defense.
+
+    Beating the defense by 5 is a heavy hit, each extra 5 is a brutal hit. This
+    only works on integers, without touching any actor.
+
+    Parameters:
+        margin (int): The attack total minus the target's physical defense.
+        is_critical_hit (bool): Whether the attack roll is a critical hit.
+        hit_damage (int): The bonus of every hit.
+        heavy_hit_damage (int): The bonus of a heavy hit.
+        brutal_hit_damage (int): The bonus of each brutal hit.
+        critical_hit_damage (int): The bonus of a critical hit.
+
+    Returns:
+        Tuple[bool, int, int]: Whether the hit is heavy, the number of brutal hits
+            (0 if the hit is not heavy), and the damage bonus.
+    """
+    is_heavy_hit = margin >= 5
+    if is_heavy_hit:
+        # The number of brutal hit "by 5"
+        N_brutal_hit = margin // 5 - 1
+        damage_bonus = hit_damage + heavy_hit_damage + N_brutal_hit * brutal_hit_damage
+    else:
+        N_brutal_hit = 0
+        damage_bonus = hit_damage
+    if is_critical_hit:
+        damage_bonus += critical_hit_damage
+    return is_heavy_hit, N_brutal_hit, damage_bonus
+
+
+# Help bonus die by number of helps already given this round: 1d8, 1d6, then 1d4
+_HELP_DICE = (8, 6, 4)
+
+# Attack roll breakdowns, indexed by (Help bonus) | (Bless bonus) << 1
+_ROLL_LOG_FORMATS = (
+    "    %s rolls a %s + %s (prime) + %s (CM)",
+    "    %s rolls a %s + %s (prime) + %s (CM) + %s (Help)",
+    "    %s rolls a %s + %s (prime) + %s (CM) + %s (Bless)",
+    "    %s rolls a %s + %s (prime) + %s (CM) + %s (Help) + %s (Bless)",
+)
+
+
+class Action:
     """
-    Abstract base class for actions. Defines common attributes and methods for all actions.
+    Base class for actions. Defines common attributes and methods for all actions.
+
+    Actions are shared by every actor using them, so they are slotted: the three
+    costs live in a single (action, mana, stamina) tuple read once per execution.
     """
 
+    __slots__ = ("_costs", "_apply_costs")
+
     def __init__(
         self,
         action_points_cost: int = 0,
         mana_points_cost: int = 0,
         stamina_points_cost: int = 0,
     ):
-        self.action_points_cost = action_points_cost
-        self.mana_points_cost = mana_points_cost
-        self.stamina_points_cost = stamina_points_cost
+        self._set_costs(action_points_cost, mana_points_cost, stamina_points_cost)
 
-    def _apply_costs(self, actor: "Actor"):
-        """
-        Deducts action costs from the actor if they have enough points.
+    @property
+    def action_points_cost(self) -> int:
+        return self._costs[0]
 
-        Parameters:
-            actor (Actor): The actor performing the action.
+    @action_points_cost.setter
+    def action_points_cost(self, value: int):
+        self._set_costs(value, self._costs[1], self._costs[2])
+
+    @property
+    def mana_points_cost(self) -> int:
+        return self._costs[1]
+
+    @mana_points_cost.setter
+    def mana_points_cost(self, value: int):
+        self._set_costs(self._costs[0], value, self._costs[2])
+
+    @property
+    def stamina_points_cost(self) -> int:
+        return self._costs[2]
+
+    @stamina_points_cost.setter
+    def stamina_points_cost(self, value: int):
+        self._set_costs(self._costs[0], self._costs[1], value)
 
-        Returns:
-            bool: True if the actor has enough points to perform the action, False otherwise.
+    def _set_costs(
+        self, action_points_cost: int, mana_points_cost: int, stamina_points_cost: int
+    ):
         """
-        if actor.current_action_points < self.action_points_cost:
-            logger.warning(
-                f"{actor.name} does not have enough action points to perform this action."
-            )
-            return False
-        if actor.current_mana_points < self.mana_points_cost:
-            print(actor.current_mana_points, self.mana_points_cost)
-            logger.warning(
-                f"{actor.name} does not have enough mana points to perform this action."
-            )
-            return False
-        if actor.current_stamina_points < self.stamina_points_cost:
-            logger.warning(
-                f"{actor.name} does not have enough stamina points to perform this action."
+        Sets the costs of the action and picks how they are paid: only the points
+        the action actually costs are checked.
+        """
+        # Partials of module-level functions keep the actions picklable
+        self._costs = (action_points_cost, mana_points_cost, stamina_points_cost)
+        if mana_points_cost or stamina_points_cost:
+            self._apply_costs = partial(
+                _pay_costs, action_points_cost, mana_points_cost, stamina_points_cost
             )
-            return False
-
-        actor.current_action_points -= self.action_points_cost
-        actor.current_mana_points -= self.mana_points_cost
-        actor.current_stamina_points -= self.stamina_points_cost
-        return True
+        elif action_points_cost:
+            self._apply_costs = partial(_pay_action_points, action_points_cost)
+        else:
+            self._apply_costs = _no_costs
 
-    @abstractmethod
     def execute(self, source: "Actor", target: "Actor" = None, *args, **kwargs):
         """
         Executes the action. Must be implemented by subclasses.
@@ -70,7 +245,7 @@ class Action(ABC):
             source (Actor): The actor performing the action.
             target (List[Actor], optional): The target of the action.
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement execute().")
 
 
 class GainAdvantage(Action):
@@ -78,6 +253,8 @@ class GainAdvantage(Action):
     Action to gain an advantage on your next attack.
     """
 
+    __slots__ = ()
+
     def __init__(self, action_points_cost: int = 1):
         super().__init__(action_points_cost=action_points_cost)
 
@@ -86,8 +263,9 @@ class GainAdvantage(Action):
             return
 
         source.advantage_count += 1
-        logger.info(f"{source.name} gains advantage. ({self.action_points_cost}AP)")
-        logger.info(f"    * Advantage count is now {source.advantage_count}.")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{source.name} gains advantage. ({self.action_points_cost}AP)")
+            logger.info(f"    * Advantage count is now {source.advantage_count}.")
 
 
 class Attack(Action):
@@ -95,6 +273,8 @@ class Attack(Action):
     Action to perform a simple attack.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         action_points_cost: int = 1,
@@ -107,128 +287,125 @@ class Attack(Action):
         if not self._apply_costs(source):
             return
 
-        source.attack_count += 1
+        # Skip building the log messages altogether when nobody reads them
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        attack_count = source.attack_count + 1
+        source.attack_count = attack_count
         advantage_count = source.advantage_count
 
-        # Determine disadvantage based on dodging or full dodging status
-        disadvantage_count = max(
-            0, source.attack_count - source.max_attack_before_penalty
+        # Determine disadvantage based on the number of attacks this turn and on
+        # dodging or full dodging status (a bool, counted as 0 or 1)
+        penalty = attack_count - source.max_attack_before_penalty
+        disadvantage_count = (penalty if penalty > 0 else 0) + (
+            target.is_full_dodging or target.is_dodging
         )
-        if target.is_full_dodging or target.is_dodging:
-            disadvantage_count += 1
-            # Then remove "simple" dodging
-            target.is_dodging = False
+        # Then remove "simple" dodging, which is a no-op if the target was not dodging
+        target.is_dodging = False
 
-        # Determine the number of dice rolls based on advantage and disadvantage
+        # Advantages and disadvantages cancel each other out, the remaining ones
+        # are extra d20 rolls, keeping the highest (advantage) or lowest roll.
         # Here, contrary to previous versions, each target gets its own attack roll
-        rolls = [
-            random.randint(1, 20)
-            for _ in range(max(disadvantage_count + 1 - advantage_count, 1))
-        ]
-
-        if advantage_count > disadvantage_count:
-            attack_roll = max(rolls)  # Use the highest roll due to advantage
-            advantage_count = 0  # Reset advantage count after use
+        extra_rolls = advantage_count - disadvantage_count
+        if extra_rolls > 0:
+            attack_roll = max(roll_many(20, extra_rolls + 1))
+            # The advantage is spent on this attack (see GainAdvantage)
+            source.advantage_count = 0
+        elif extra_rolls < 0:
+            attack_roll = min(roll_many(20, 1 - extra_rolls))
         else:
-            attack_roll = min(rolls)  # Use the lowest roll due to disadvantage
+            # Most attacks are a single d20, no need for a list
+            attack_roll = roll(20)
 
         # General bonus (from bless)
         bonus_to_hit = source.get_bonus_roll()
 
+        # Each of these is read several times below, some are computed properties
+        prime_modifier = source.prime_modifier
+        combat_mastery = source.combat_mastery
+        one_time_hit_bonus = source.one_time_hit_bonus
+
         attack_tot = (
             attack_roll
-            + source.prime_modifier
-            + source.combat_mastery
-            + source.one_time_hit_bonus
+            + prime_modifier
+            + combat_mastery
+            + one_time_hit_bonus
             + bonus_to_hit
         )
         is_critical_hit = attack_roll == source.critical_hit_threshold
 
         # Apply weapon styles and calculate total attack roll for the target
         # Assumes the actor uses the first weapon in their inventory
-        if source.weapons:
-            weapon = source.weapons[0]
+        weapons = source.weapons
+        if weapons:
+            weapon = weapons[0]
         else:
             raise ValueError(f"{source.name} has no weapon equipped!")
 
         bonus_dmg_ws, bonus_hit_ws = weapon.apply_styles(target)
         attack_tot_target = attack_tot + bonus_hit_ws
 
-        logger.info(
-            f"{source.name} attacks {target.name} ! ({self.action_points_cost}AP)"
-        )
+        if log_info:
+            logger.info(
+                f"{source.name} attacks {target.name} ! ({self.action_points_cost}AP)"
+            )
 
-        # Get precise logs for the rolls
-        if source.one_time_hit_bonus > 0:
-            if bonus_to_hit == 0:
-                logger.info(
-                    f"    {source.name} rolls a {attack_roll} + {source.prime_modifier} (prime) + {source.combat_mastery} (CM) + {source.one_time_hit_bonus} (Help)"
-                )
-            else:
-                logger.info(
-                    f"    {source.name} rolls a {attack_roll} + {source.prime_modifier} (prime) + {source.combat_mastery} (CM) + {source.one_time_hit_bonus} (Help) + {bonus_to_hit} (Bless)"
-                )
-        else:
-            if bonus_to_hit == 0:
-                logger.info(
-                    f"    {source.name} rolls a {attack_roll} + {source.prime_modifier} (prime) + {source.combat_mastery} (CM)"
-                )
-            else:
-                logger.info(
-                    f"    {source.name} rolls a {attack_roll} + {source.prime_modifier} (prime) + {source.combat_mastery} (CM) + {bonus_to_hit} (Bless)"
-                )
+            # Get precise logs for the rolls, the template depends on which of the
+            # Help and Bless bonuses apply
+            roll_args = [source.name, attack_roll, prime_modifier, combat_mastery]
+            if one_time_hit_bonus > 0:
+                roll_args.append(one_time_hit_bonus)
+            if bonus_to_hit != 0:
+                roll_args.append(bonus_to_hit)
+            logger.info(
+                _ROLL_LOG_FORMATS[(one_time_hit_bonus > 0) | (bonus_to_hit != 0) << 1],
+                *roll_args,
+            )
 
         # Remove any one-time hit bonus after it's used
-        source.one_time_hit_bonus = 0
-
-        if attack_tot_target >= target.physical_defense or is_critical_hit:
-            logger.info(f"    {source.name}'s attack hits {target.name}.")
-
-            if is_critical_hit:
-                logger.info(f"        Critical hit !")
-
-            if attack_tot_target >= target.physical_defense + 5:
-                is_heavy_hit = True
-                # The number of brutal hit "by 5"
-                N_brutal_hit = (
-                    int((attack_tot_target - target.physical_defense) // 5) - 1
-                )
-                damage_bonus = (
-                    source.heavy_hit_damage + N_brutal_hit * source.brutal_hit_damage
-                )
-                if N_brutal_hit > 0:
+        if one_time_hit_bonus:
+            source.one_time_hit_bonus = 0
+
+        # By how much the attack beats the target's physical defense
+        margin = attack_tot_target - target.physical_defense
+
+        if margin >= 0 or is_critical_hit:
+            if log_info:
+                logger.info(f"    {source.name}'s attack hits {target.name}.")
+                if is_critical_hit:
+                    logger.info(f"        Critical hit !")
+
+            is_heavy_hit, N_brutal_hit, damage_bonus = _hit_damage_bonus(
+                margin,
+                is_critical_hit,
+                source.hit_damage,
+                source.heavy_hit_damage,
+                source.brutal_hit_damage,
+                source.critical_hit_damage,
+            )
+            if log_info and is_heavy_hit:
+                if N_brutal_hit:
                     logger.info(f"        Brutal hit !")
                 else:
                     logger.info(f"        Heavy hit !")
 
-            else:
-                is_heavy_hit = False
-                damage_bonus = 0
-
-            if is_critical_hit:
-                damage_bonus += source.critical_hit_damage
-
-            # Add regular damage bonus from rage or other traits)
-            damage_bonus += source.hit_damage
-            for ij in range(len(weapon.damages)):
-                if ij == 0:
-                    total_damage = (
-                        weapon.damages[ij].value + damage_bonus + bonus_dmg_ws
-                    )
-                else:
-                    total_damage = weapon.damages[ij].value
-
-                # A Heavy Hit or Critical Hit bypasses DR
-                target.take_damage(
-                    [
-                        Damage(
-                            damage_type=weapon.damages[ij].damage_type,
-                            value=total_damage,
-                        )
-                    ],
-                    ignore_damage_reduction=is_critical_hit + is_heavy_hit,
+            # The bonuses only apply to the first damage of the weapon, the other
+            # ones are shared as is, then all the damages of the hit are taken at once
+            weapon_damages = weapon.damages
+            main_damage = weapon_damages[0]
+            damages = [
+                Damage(
+                    main_damage.damage_type,
+                    main_damage.value + damage_bonus + bonus_dmg_ws,
                 )
-        else:
+            ]
+            damages += weapon_damages[1:]
+
+            # A Heavy Hit or Critical Hit bypasses DR
+            target.take_damage(
+                damages, ignore_damage_reduction=is_critical_hit or is_heavy_hit
+            )
+        elif log_info:
             logger.info(f"    {source.name}'s attack missed {target.name}.")
 
 
@@ -237,6 +414,8 @@ class InflictDamage(Action):
     Action to inflict damage directly.
     """
 
+    __slots__ = ("damages",)
+
     def __init__(
         self,
         action_points_cost: int = 0,
@@ -251,16 +430,21 @@ class InflictDamage(Action):
         if not self._apply_costs(source):
             return
 
+        log_info = logger.isEnabledFor(logging.INFO)
+        damages = self.damages
         for target in targets:
-            logger.info(f"{source.name} inflicts damage on {target.name}")
-            for damage in self.damages:
+            if log_info:
+                logger.info(f"{source.name} inflicts damage on {target.name}")
+                for damage in damages:
+                    logger.info(
+                        f"{source.name} inflicts {damage.value} {damage.damage_type} damage to {target.name}"
+                    )
+            # The damages are shared by all the targets and taken at once
+            target.take_damage(damages)
+            if log_info:
                 logger.info(
-                    f"{source.name} inflicts {damage.value} {damage.damage_type} damage to {target.name}"
+                    f"{target.name} has {target.current_health_points} health left."
                 )
-                target.take_damage([damage])
-            logger.info(
-                f"{target.name} has {target.current_health_points} health left."
-            )
 
 
 class Target(Action):
@@ -270,6 +454,8 @@ class Target(Action):
     Not fully implemented and integrated with the rest of the code.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         action_points_cost: int = 0,
@@ -284,9 +470,10 @@ class Target(Action):
             return
 
         source.current_target = target
-        logger.info(
-            f"{source.name} now targets {target.name} ({self.action_points_cost}AP)."
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"{source.name} now targets {target.name} ({self.action_points_cost}AP)."
+            )
 
 
 class MoveToTarget(Action):
@@ -296,6 +483,8 @@ class MoveToTarget(Action):
     Not fully implemented and integrated with the rest of the code.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         action_points_cost: int = 1,
@@ -310,9 +499,10 @@ class MoveToTarget(Action):
             return
 
         source.current_target = target
-        logger.info(
-            f"{source.name} moves to reach {target.name} ({self.action_points_cost}AP)."
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"{source.name} moves to reach {target.name} ({self.action_points_cost}AP)."
+            )
 
 
 class Disengage(Action):
@@ -322,6 +512,8 @@ class Disengage(Action):
     Not fully implemented and integrated with the rest of the code.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         action_points_cost: int = 1,
@@ -331,18 +523,22 @@ class Disengage(Action):
         super().__init__(action_points_cost, mana_points_cost, stamina_points_cost)
 
     def execute(self, source: "Actor", target: Optional["Actor"] = None):
-        target = source if target is None else target
         if not self._apply_costs(source):
             return
 
-        logger.info(f"{source.name} disengages from combat")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"{source.name} disengages from combat")
 
 
 class Dodge(Action):
     """
     Action to dodge.
+
+    An actor always dodges for themselves: the target, if any, is ignored.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         action_points_cost: int = 1,
@@ -352,21 +548,25 @@ class Dodge(Action):
         super().__init__(action_points_cost, mana_points_cost, stamina_points_cost)
 
     def execute(self, source: "Actor", target: Optional["Actor"] = None):
-        target = source if target is None else target
         if not self._apply_costs(source):
             return
 
-        target.is_dodging = True
-        logger.info(
-            f"{source.name} prepares to dodge the next attack. ({self.action_points_cost}AP)"
-        )
+        source.is_dodging = True
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"{source.name} prepares to dodge the next attack. ({self.action_points_cost}AP)"
+            )
 
 
 class Full_Dodge(Action):
     """
     Action to full dodge.
+
+    An actor always dodges for themselves: the target, if any, is ignored.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         action_points_cost: int = 2,
@@ -376,14 +576,14 @@ class Full_Dodge(Action):
         super().__init__(action_points_cost, mana_points_cost, stamina_points_cost)
 
     def execute(self, source: "Actor", target: Optional["Actor"] = None):
-        target = source if target is None else target
         if not self._apply_costs(source):
             return
 
-        target.is_full_dodging = True
-        logger.info(
-            f"{source.name} prepares to dodge all the attacks.  ({self.action_points_cost}AP)"
-        )
+        source.is_full_dodging = True
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"{source.name} prepares to dodge all the attacks.  ({self.action_points_cost}AP)"
+            )
 
 
 class Grapple(Action):
@@ -393,6 +593,8 @@ class Grapple(Action):
     Not fully implemented and integrated with the rest of the code.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         action_points_cost: int = 1,
@@ -405,8 +607,9 @@ class Grapple(Action):
         if not self._apply_costs(source):
             return
 
-        for target in targets:
-            logger.info(f"{source.name} attempts to grapple {target.name}")
+        if logger.isEnabledFor(logging.INFO):
+            for target in targets:
+                logger.info(f"{source.name} attempts to grapple {target.name}")
 
 
 class Help(Action):
@@ -414,6 +617,8 @@ class Help(Action):
     Action to help allies, providing a hit bonus.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         action_points_cost: int = 1,
@@ -426,19 +631,15 @@ class Help(Action):
         if not self._apply_costs(source):
             return
 
-        if source.help_count == 0:
-            bonus = random.randint(1, 8)  # Roll a 1d8 for the bonus
-        elif source.help_count == 1:
-            bonus = random.randint(1, 6)  # Roll a 1d6 for the bonus
-        else:
-            bonus = random.randint(1, 4)  # Roll a 1d4 for the bonus
-
-        source.help_count += 1
+        help_count = source.help_count
+        bonus = roll(_HELP_DICE[help_count if help_count < 2 else 2])
+        source.help_count = help_count + 1
 
         target.one_time_hit_bonus += bonus
-        logger.info(
-            f"{source.name} helps {target.name}.  ({self.action_points_cost}AP)"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"{source.name} helps {target.name}.  ({self.action_points_cost}AP)"
+            )
 
 
 class ImposeTrait(Action):
@@ -446,6 +647,8 @@ class ImposeTrait(Action):
     Action to impose conditions on targets.
     """
 
+    __slots__ = ("traits",)
+
     def __init__(
         self,
         action_points_cost: int = 0,
@@ -460,20 +663,35 @@ class ImposeTrait(Action):
         if not self._apply_costs(source):
             return
 
-        print(source.name)
+        log_info = logger.isEnabledFor(logging.INFO)
+        traits = self.traits
         for target in targets:
-            print(target.name)
-            logger.info(f"{source.name} is imposing conditions on {target.name}")
-            for trait in self.traits:
-                logger.info(f"{source.name} imposes {trait.name} on {target.name}")
-                target.add_trait(trait)
+            if log_info:
+                logger.info(f"{source.name} is imposing conditions on {target.name}")
+                for trait in traits:
+                    logger.info(f"{source.name} imposes {trait.name} on {target.name}")
+            # All the traits are added at once, the target's cache is only
+            # invalidated once
+            target.add_trait(traits)
 
 
 class ImposeSavingThrow(Action):
     """
     Action to impose a saving throw check on targets.
+
+    Each target rolls its own save, then the actions of its outcome are executed,
+    and their costs paid, for that target alone before the next target rolls.
     """
 
+    __slots__ = (
+        "stat",
+        "difficulty",
+        "_on_success",
+        "_on_failure",
+        "_success_executes",
+        "_failure_executes",
+    )
+
     def __init__(
         self,
         stat: str,
@@ -490,37 +708,63 @@ class ImposeSavingThrow(Action):
         self.on_success = on_success
         self.on_failure = on_failure
 
+    # The actions are kept as tuples, like CompositeAction.actions, and the bound
+    # execute methods are looked up once, when they are set
+    @property
+    def on_success(self) -> Tuple["Action", ...]:
+        return self._on_success
+
+    @on_success.setter
+    def on_success(self, actions: List["Action"]):
+        self._on_success = tuple(actions)
+        self._success_executes = _execute_methods(self._on_success)
+
+    @property
+    def on_failure(self) -> Tuple["Action", ...]:
+        return self._on_failure
+
+    @on_failure.setter
+    def on_failure(self, actions: List["Action"]):
+        self._on_failure = tuple(actions)
+        self._failure_executes = _execute_methods(self._on_failure)
+
     def execute(self, source: "Actor", targets: List["Actor"]):
         if not self._apply_costs(source):
             return
 
-        for target in targets:
-            roll = random.randint(1, 20)
-            stat_value = getattr(target, self.stat, 0)
-            total = roll + stat_value
+        log_info = logger.isEnabledFor(logging.INFO)
+        stat = self.stat
+        difficulty = self.difficulty
 
-            if total >= self.difficulty:
-                logger.info(f"{target.name} succeeds on the {self.stat} saving throw")
-                self._execute_actions(self.on_success, source, target)
+        # Each target rolls its save and suffers its outcome before the next one
+        for target in targets:
+            if roll(20) + getattr(target, stat, 0) >= difficulty:
+                if log_info:
+                    logger.info(f"{target.name} succeeds on the {stat} saving throw")
+                self._execute_actions(self._success_executes, source, target)
             else:
-                logger.info(f"{target.name} fails the {self.stat} saving throw")
-                self._execute_actions(self.on_failure, source, target)
+                if log_info:
+                    logger.info(f"{target.name} fails the {stat} saving throw")
+                self._execute_actions(self._failure_executes, source, target)
 
     def _execute_actions(
-        self, actions: List["Action"], source: "Actor", target: "Actor"
+        self, executes: Tuple[Callable, ...], source: "Actor", target: "Actor"
     ):
         """
         Helper method to execute a list of actions.
 
         Parameters:
-            actions (List[Action]): The actions to execute.
+            executes (Tuple[Callable, ...]): The bound execute methods of the actions.
             source (Actor): The source of the actions, i.e., who pays the cost.
-            target (Actor): The target of the actions.
+            target (Actor): The target of the actions, each action is executed (and
+                paid) once per target.
 
         Nota Bene : for a "self" spell, source = target.
         """
-        for action in actions:
-            action.execute(source, [target])
+        # The same one-element list is handed to every action
+        targets = [target]
+        for execute in executes:
+            execute(source, targets)
 
 
 class CompositeAction(Action):
@@ -528,6 +772,8 @@ class CompositeAction(Action):
     Composite action to execute multiple actions sequentially.
     """
 
+    __slots__ = ("_actions", "_executes")
+
     def __init__(
         self,
         actions: List["Action"],
@@ -538,9 +784,21 @@ class CompositeAction(Action):
         super().__init__(action_points_cost, mana_points_cost, stamina_points_cost)
         self.actions = actions
 
+    # The actions are kept as a tuple: changing them in place would not update the
+    # bound execute methods, so they are only changed by setting them again
+    @property
+    def actions(self) -> Tuple["Action", ...]:
+        return self._actions
+
+    @actions.setter
+    def actions(self, actions: List["Action"]):
+        # The bound execute methods are looked up once, not at every execution
+        self._actions = tuple(actions)
+        self._executes = _execute_methods(self._actions)
+
     def execute(self, source: "Actor", target: Optional["Actor"] = None):
         if not self._apply_costs(source):
             return
 
-        for action in self.actions:
-            action.execute(source, target)
+        for execute in self._executes:
+            execute(source, target)
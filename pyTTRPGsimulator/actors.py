@@ -1,11 +1,12 @@
 import logging
-from typing import List, Optional, Type, Dict, Union
-import random
+from typing import List, Optional, Set, Tuple, Type, Dict, Union
+from itertools import chain
 import math
 import copy
 
 from .items import Item, Armor, Weapon, ItemManager
-from .damages import Damage, Physical
+from .damages import Damage
+from .dice import roll
 from .modifiers import DamageModifier
 from .combat_strategies import DefaultStrategy
 from .targeting_strategies import TargetWeakestStrategy
@@ -13,28 +14,60 @@ from .attributes import Attributes, actor_attributes
 from .traits import Trait
 from .entity import Entity
 
+__all__ = ["Actor"]
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
-logger.info("This is a test info message from module actors")
-logger.error("This is a test error message from module actors")
+# Strategies hold no state, so actors built without one share these instances
+_default_combat_strategy = DefaultStrategy()
+_default_targeting_strategy = TargetWeakestStrategy()
 
 
 class Actor(Entity):
+    __slots__ = (
+        "_cached_prime_modifier",
+        "_cached_max_points",
+        "item_manager",
+        "is_concentrating",
+        "is_concentrating_on",
+        "combat_strategy",
+        "_current_target",
+        "targeted_by",
+        "targeting_enemies",
+        "targeting_strategy",
+        "attack_count",
+        "advantage_count",
+        "one_time_hit_bonus",
+        "help_count",
+        "is_dodging",
+        "is_full_dodging",
+        "position_X",
+        "position_Y",
+        "is_team_A",
+        "current_health_points",
+        "current_stamina_points",
+        "current_grit_points",
+        "current_mana_points",
+        "current_action_points",
+    )
+
     def __init__(
         self,
         name: str = "",
         items: Optional[List["Item"]] = None,
         traits: Optional[Union["Trait", List["Trait"]]] = None,
         attributes: "Attributes" = None,
-        targeting_strategy=TargetWeakestStrategy(),
-        combat_strategy=DefaultStrategy(),
+        targeting_strategy=None,
+        combat_strategy=None,
         **kwargs,  # Check the Attributes class to know these additional arguments
     ):
 
         # Lazy evaluation cache
         self._cached_attributes = None
         self._cached_modifiers: Dict[Type[DamageModifier], List[DamageModifier]] = {}
+        self._cached_prime_modifier: Optional[int] = None
+        self._cached_max_points: Optional[Tuple[int, int, int, int, int]] = None
 
         # Items management
         self.item_manager = ItemManager()
@@ -43,10 +76,17 @@ class Actor(Entity):
         # Combat-related properties
         self.is_concentrating = False
         self.is_concentrating_on = []
-        self.combat_strategy = combat_strategy
-        self.current_target: Optional["Actor"] = None
-        self.targeting_enemies: List["Actor"] = []
-        self.targeting_strategy = targeting_strategy
+        self.combat_strategy = (
+            combat_strategy if combat_strategy is not None else _default_combat_strategy
+        )
+        self._current_target: Optional["Actor"] = None
+        self.targeted_by: Set["Actor"] = set()  # Actors whose current target is self
+        self.targeting_enemies: Set["Actor"] = set()  # The enemies among them
+        self.targeting_strategy = (
+            targeting_strategy
+            if targeting_strategy is not None
+            else _default_targeting_strategy
+        )
         self.attack_count = 0  # Track the number of attacks in the current turn
         self.advantage_count = 0  # Track the number of advantages gained
         self.one_time_hit_bonus = 0  # A bonus from help action
@@ -55,6 +95,7 @@ class Actor(Entity):
         self.is_full_dodging = False
         self.position_X = 0
         self.position_Y = 0
+        self.is_team_A: Optional[bool] = None  # Set when the actor joins a combat
 
         #  DANGER : A deepcopy is required to avoid sharing attributes among actors
         attributes = (
@@ -63,11 +104,13 @@ class Actor(Entity):
         super().__init__(name=name, traits=traits, attributes=attributes, **kwargs)
 
         # Set resources
-        self.current_health_points = self.max_health_points
-        self.current_stamina_points = self.max_stamina_points
-        self.current_grit_points = self.max_grit_points
-        self.current_mana_points = self.max_mana_points
-        self.current_action_points = self.max_action_points
+        (
+            self.current_health_points,
+            self.current_stamina_points,
+            self.current_grit_points,
+            self.current_mana_points,
+            self.current_action_points,
+        ) = self.max_points
 
     def reset_attack_count(self):
         self.attack_count = 0
@@ -75,6 +118,25 @@ class Actor(Entity):
     def reset_advantage_count(self):
         self.advantage_count = 0
 
+    # Assigning the current target keeps the targeted_by and targeting_enemies sets
+    # in sync
+    @property
+    def current_target(self) -> Optional["Actor"]:
+        return self._current_target
+
+    @current_target.setter
+    def current_target(self, target: Optional["Actor"]):
+        current_target = self._current_target
+        if current_target is not None:
+            current_target.targeted_by.discard(self)
+            current_target.targeting_enemies.discard(self)
+        self._current_target = target
+        if target is not None:
+            target.targeted_by.add(self)
+            is_team_A = self.is_team_A
+            if is_team_A is not None and target.is_team_A == (not is_team_A):
+                target.targeting_enemies.add(self)
+
     def update_targeting(self, team_allies: List["Actor"], team_enemies: List["Actor"]):
         """
         Update the current target of the actor based on the given allies and enemies.
@@ -82,17 +144,20 @@ class Actor(Entity):
         self.targeting_strategy.select_target(self, team_allies, team_enemies)
 
     def roll_initiative(self):
-        roll = random.randint(1, 20) + self.get_bonus_roll()
+        initiative_roll = roll(20) + self.get_bonus_roll()
         bonus = self.attributes.initiative
-        if bonus != 0:
-            logger.info(f"{self.name} gets {roll + bonus} ({roll} + {bonus})")
-        else:
-            logger.info(f"{self.name} gets {roll}")
+        if logger.isEnabledFor(logging.INFO):
+            if bonus != 0:
+                logger.info(
+                    f"{self.name} gets {initiative_roll + bonus} ({initiative_roll} + {bonus})"
+                )
+            else:
+                logger.info(f"{self.name} gets {initiative_roll}")
 
-        return roll + bonus
+        return initiative_roll + bonus
 
     def roll_save(self, characteristic):
-        roll = random.randint(1, 20) + self.get_bonus_roll()
+        save_roll = roll(20) + self.get_bonus_roll()
 
         if characteristic.upper() == "MIGHT":
             bonus = self.might
@@ -107,42 +172,55 @@ class Actor(Entity):
         elif characteristic.upper() == "MENTAL":
             bonus = max(self.intelligence, self.charisma)
 
-        return roll + bonus
+        return save_roll + bonus
 
     def maintain_concentration(self, damage):
         # Rules page 58 for concentration
         mental_save = self.roll_save("MENTAL")
         DC = max(10, 2 * damage)
+        log_info = logger.isEnabledFor(logging.INFO)
 
         # Lose concentration if at death's door (p 35) or if dead or if fail save
         if self.is_at_death_door or self.is_dead:
-            logger.info(f"        * {self.name} is dead or at Death's Doors.")
+            if log_info:
+                logger.info(f"        * {self.name} is dead or at Death's Doors.")
             self.remove_concentration()
             return
 
-        logger.info(
-            f"        * {self.name} tries to maintain concentration and rolls a {mental_save} against a DC of {DC}."
-        )
+        if log_info:
+            logger.info(
+                f"        * {self.name} tries to maintain concentration and rolls a {mental_save} against a DC of {DC}."
+            )
 
         # Save to keep concentration !
         if mental_save >= DC:
-            logger.info(f"        * {self.name} keeps concentrating.")
+            if log_info:
+                logger.info(f"        * {self.name} keeps concentrating.")
             return
         else:
             return self.remove_concentration()
 
     def remove_concentration(self):
         # Sometimes, you have to lose your concentration...
+        log_info = logger.isEnabledFor(logging.INFO)
         for spell in self.is_concentrating_on:
-            logger.info(f"        * {self.name} looses concentration on {spell.name}")
+            if log_info:
+                logger.info(
+                    f"        * {self.name} looses concentration on {spell.name}"
+                )
+            spell_traits = list(
+                chain(spell.traits, spell.traits_on_save, spell.traits_on_fail)
+            )
             for target in spell.targets:
                 # Remove all potential traits (some of them might not be present in the actor
                 # # but that's the trait manager job to handle this)
-                for trait in spell.traits + spell.traits_on_save + spell.traits_on_fail:
-                    target.remove_trait(trait)
-                    logger.info(
-                        f"            * {target.name} looses {trait.name} trait"
-                    )
+                with target.bulk_edit():
+                    for trait in spell_traits:
+                        target.remove_trait(trait)
+                        if log_info:
+                            logger.info(
+                                f"            * {target.name} looses {trait.name} trait"
+                            )
 
         self.is_concentrating_on = []
         self.is_concentrating = False
@@ -155,14 +233,22 @@ class Actor(Entity):
         else:
             self.is_concentrating_on.extend([spell])
         self.is_concentrating = True
-        logger.info(f"        * {self.name} now concentrates on {spell.name}.")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"        * {self.name} now concentrates on {spell.name}.")
 
     def get_bonus_roll(self):
-        return (
-            self.D8_roll_bonus * random.randint(1, 8)
-            + self.D6_roll_bonus * random.randint(1, 6)
-            + self.D4_roll_bonus * random.randint(1, 4)
-        )
+        # Only roll the dice that count, most actors have no bonus dice at all
+        bonus = 0
+        D8_roll_bonus = self.D8_roll_bonus
+        if D8_roll_bonus:
+            bonus += D8_roll_bonus * roll(8)
+        D6_roll_bonus = self.D6_roll_bonus
+        if D6_roll_bonus:
+            bonus += D6_roll_bonus * roll(6)
+        D4_roll_bonus = self.D4_roll_bonus
+        if D4_roll_bonus:
+            bonus += D4_roll_bonus * roll(4)
+        return bonus
 
     def calculate_damage_taken(
         self, damage: "Damage", ignore_damage_reduction=False
@@ -177,54 +263,25 @@ class Actor(Entity):
         Returns:
             float: The final damage value after all modifications.
         """
-        # Initial damage value
-        damage_value = damage.value
-
-        # Directly use the type of the damage type
-        damage_type = type(damage.damage_type)
-
-        # Gather all resistances and vulnerabilities of the same damage type
-        resistances = [
-            res for res in self.resistances if isinstance(res.damage_type, damage_type)
-        ]
-        vulnerabilities = [
-            vul
-            for vul in self.vulnerabilities
-            if isinstance(vul.damage_type, damage_type)
-        ]
-
-        # Apply additive and multiplicative resistances
-        additive_resistance = sum(
-            res.value for res in resistances if not res.is_multiplicative
-        )
-        multiplicative_resistance = 1
-        for res in resistances:
-            if res.is_multiplicative:
-                multiplicative_resistance *= res.value
-
-        damage_value = (damage_value - additive_resistance) * multiplicative_resistance
-
-        # Apply additive and multiplicative vulnerabilities
-        additive_vulnerability = sum(
-            vul.value for vul in vulnerabilities if not vul.is_multiplicative
-        )
-        multiplicative_vulnerability = 1
-        for vul in vulnerabilities:
-            if vul.is_multiplicative:
-                multiplicative_vulnerability *= vul.value
-
+        # Resistances, vulnerabilities and armor reduction of the same damage type,
+        # aggregated once
+        (
+            additive_resistance,
+            multiplicative_resistance,
+            additive_vulnerability,
+            multiplicative_vulnerability,
+            damage_reduction,
+        ) = self.calculate_damage_profile(type(damage.damage_type))
+
+        # Apply resistances, then vulnerabilities
+        damage_value = (damage.value - additive_resistance) * multiplicative_resistance
         damage_value = (
             damage_value + additive_vulnerability
         ) * multiplicative_vulnerability
 
         # Apply armor reduction based on damage type (except if ignore_damage_reduction=True)
         if not ignore_damage_reduction:
-            reduction = (
-                self.attributes.mystical_damage_reduction
-                if not isinstance(damage.damage_type, Physical)
-                else self.attributes.physical_damage_reduction
-            )
-            damage_value -= reduction
+            damage_value -= damage_reduction
 
         # Ensure the damage value is not negative
         damage_value = max(damage_value, 0)
@@ -235,8 +292,12 @@ class Actor(Entity):
         """
         Apply a list of damages to the actor, updating health points accordingly.
         Log each type of damage separately in a detailed and structured way.
+
+        The damages may be shared with the weapon or action that produced them:
+        they are read only, and neither they nor the list are kept afterwards.
         """
         total_damage = 0
+        log_info = logger.isEnabledFor(logging.INFO)
         damage_report = []
 
         for damage in damages:
@@ -244,38 +305,36 @@ class Actor(Entity):
                 damage, ignore_damage_reduction
             )
             total_damage += calculated_damage
-            damage_report.append(
-                f"            * {calculated_damage} {damage.damage_type} damage"
-            )
+            if log_info:
+                damage_report.append(
+                    f"            * {calculated_damage} {damage.damage_type} damage"
+                )
 
         self.current_health_points -= total_damage
 
-        # Log the detailed damage report
-        logger.info(f"        * {self.name} took {total_damage} total damage:")
-        for report in damage_report:
-            logger.info(report)
+        if log_info:
+            # Log the detailed damage report
+            logger.info(f"        * {self.name} took {total_damage} total damage:")
+            for report in damage_report:
+                logger.info(report)
 
-        # Log the remaining health points
-        logger.info(
-            f"        * {self.name} now has {self.current_health_points} HP left."
-        )
+            # Log the remaining health points
+            logger.info(
+                f"        * {self.name} now has {self.current_health_points} HP left."
+            )
 
         # If the actor is concentrating, they have to do a mental save to keep it.
         if self.is_concentrating:
             self.maintain_concentration(total_damage)
 
     def add_item(self, item: Union[Item, List[Item]]):
-        if isinstance(item, list):
-            self.item_manager.add_item(item)
-        else:
-            self.item_manager.add_item([item])
+        # The item manager handles both a single item and a list of items
+        self.item_manager.add_item(item)
         self.invalidate_cache()
 
     def remove_item(self, item: Union[Item, List[Item]]):
-        if isinstance(item, list):
-            self.item_manager.remove_item(item)
-        else:
-            self.item_manager.remove_item([item])
+        # The item manager handles both a single item and a list of items
+        self.item_manager.remove_item(item)
         self.invalidate_cache()
 
     def get_attribute_sources(self):
@@ -287,7 +346,7 @@ class Actor(Entity):
         sources = super().get_attribute_sources()
 
         # Add attributes from items
-        sources += [item.attributes for item in self.item_manager.get_items()]
+        sources.extend(item.attributes for item in self.item_manager.get_items())
 
         return sources
 
@@ -300,18 +359,27 @@ class Actor(Entity):
         traits = list(super().get_trait_sources())
 
         # Create a set to track seen traits and avoid duplicates
-        seen_traits = {id(trait): trait for trait in traits}
+        seen_trait_ids = {id(trait) for trait in traits}
 
         # Add traits from items, avoiding duplicates
         for item in self.item_manager.get_items():
-            if item.traits:
-                for trait in item.traits:
-                    if id(trait) not in seen_traits:
-                        traits.append(trait)
-                        seen_traits[id(trait)] = trait
+            for trait in item.traits:
+                trait_id = id(trait)
+                if trait_id not in seen_trait_ids:
+                    traits.append(trait)
+                    seen_trait_ids.add(trait_id)
 
         return traits
 
+    def invalidate_cache(self):
+        """
+        Clear cached data and force recalculation of attributes, modifiers and of
+        the values derived from them.
+        """
+        super().invalidate_cache()
+        self._cached_prime_modifier = None
+        self._cached_max_points = None
+
     def update_traits(self):
         """
         Decrement the duration of each trait. If a trait expires (duration <= 0),
@@ -330,18 +398,51 @@ class Actor(Entity):
     def prime_modifier(self) -> int:
         """
         Return the highest attribute value among Might, Agility, Intelligence, and Charisma.
+
+        The value is cached until the cache of the actor is invalidated.
         """
-        return (
-            max([self.might, self.agility, self.intelligence, self.charisma])
-            + self.prime_modifier_bonus
-        )
+        prime_modifier = self._cached_prime_modifier
+        if prime_modifier is None:
+            attributes = self.attributes
+            prime_modifier = (
+                max(
+                    attributes.might,
+                    attributes.agility,
+                    attributes.intelligence,
+                    attributes.charisma,
+                )
+                + attributes.prime_modifier_bonus
+            )
+            self._cached_prime_modifier = prime_modifier
+        return prime_modifier
 
     @property
-    def weapons(self) -> List["Weapon"]:
+    def max_points(self) -> Tuple[int, int, int, int, int]:
+        """
+        Return the maximum health, stamina, grit, mana and action points, in this
+        order.
+
+        The values are cached until the cache of the actor is invalidated.
+        """
+        max_points = self._cached_max_points
+        if max_points is None:
+            attributes = self.attributes
+            max_points = (
+                attributes.max_health_points,
+                attributes.max_stamina_points,
+                attributes.max_grit_points,
+                attributes.max_mana_points,
+                attributes.max_action_points,
+            )
+            self._cached_max_points = max_points
+        return max_points
+
+    @property
+    def weapons(self) -> Tuple["Weapon", ...]:
         return self.item_manager.get_items_of_type(Weapon)
 
     @property
-    def armors(self) -> List["Armor"]:
+    def armors(self) -> Tuple["Armor", ...]:
         return self.item_manager.get_items_of_type(Armor)
 
     @property
@@ -359,8 +460,11 @@ class Actor(Entity):
 
     @property
     def is_at_death_door(self) -> bool:
-        return (self.current_health_points < 0) & (
-            self.current_health_points > self.death_door_threshold
+        current_health_points = self.current_health_points
+        # Short-circuit: the threshold lookup is skipped for non-negative HP
+        return (
+            current_health_points < 0
+            and current_health_points > self.death_door_threshold
         )
 
     @property
@@ -368,7 +472,7 @@ class Actor(Entity):
         return not self.is_alive
 
     @property
-    def items(self):
+    def items(self) -> Tuple[Item, ...]:
         return self.item_manager.get_items()
 
     def new_turn(self):
@@ -382,7 +486,7 @@ class Actor(Entity):
 
     def new_round(self):
         self.update_traits()
-        self.current_action_points = self.max_action_points
+        self.current_action_points = self.max_points[4]
         self.reset_attack_count()
         self.reset_advantage_count()
         self.help_count = 0
@@ -391,12 +495,17 @@ class Actor(Entity):
         """
         Restore all attributes to their maximum values, simulating a full rest.
         """
-        self.current_health_points = self.max_health_points
-        self.current_stamina_points = self.max_stamina_points
-        self.current_grit_points = self.max_grit_points
-        self.current_mana_points = self.max_mana_points
-        self.current_action_points = self.max_action_points
+        (
+            self.current_health_points,
+            self.current_stamina_points,
+            self.current_grit_points,
+            self.current_mana_points,
+            self.current_action_points,
+        ) = self.max_points
         self.reset_attack_count()
         self.reset_advantage_count()
         self.help_count = 0
-        logger.info(f"{self.name} has fully rested and all attributes are restored.")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"{self.name} has fully rested and all attributes are restored."
+            )
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, fields
 
+__all__ = ["Attributes", "actor_attributes", "hero_attributes"]
+
 
 @dataclass
 class Attributes:
@@ -7,6 +7,8 @@ from copy import deepcopy
 from .actors import Actor
 from .actions import Attack, Help, GainAdvantage, Dodge, Full_Dodge
 
+__all__ = ["CombatManager", "run_simulations", "plot_simulation_results"]
+
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -241,18 +243,22 @@ class CombatManager:
         Parameters:
             actor (Actor): The actor whose turn is to be executed.
         """
-        logger.info(f"")
-        logger.info(f"{actor.name}'s turn:")
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"")
+            logger.info(f"{actor.name}'s turn:")
 
         if actor.is_dead:
-            logger.info(f"{actor.name} is dead !")
+            if log_info:
+                logger.info(f"{actor.name} is dead !")
 
         else:
 
             if actor.is_at_death_door:
-                logger.info(
-                    f"{actor.name} is at Death's doors has only {actor.death_door_action} AP !"
-                )
+                if log_info:
+                    logger.info(
+                        f"{actor.name} is at Death's doors has only {actor.death_door_action} AP !"
+                    )
                 actor.current_action_points = actor.death_door_action
 
             # Time to update the target of the actor
@@ -267,7 +273,6 @@ class CombatManager:
             ):
 
                 # Always attempt to re-actualize targeting (dead enemy for instance)
-                allies, enemies = self.get_allies_enemies(actor)
                 actor.update_targeting(allies, enemies)
 
                 # The previous targeting could have cost an AP
@@ -287,6 +292,9 @@ class CombatManager:
                 if self.is_combat_over():
                     return
 
+                # Only actions can kill, so the alive lists are refreshed after them
+                allies, enemies = self.get_allies_enemies(actor)
+
     def is_combat_over(self):
         """
         Check if the combat is over.
@@ -302,6 +310,9 @@ class CombatManager:
         """
         Log the status of all alive actors.
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         alive_actors = [actor for actor in self.team_a + self.team_b if actor.is_alive]
         logger.info(f"")
         logger.info(f"################ NEW ROUND ################")
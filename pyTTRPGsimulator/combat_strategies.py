@@ -7,6 +7,19 @@ import random
 if TYPE_CHECKING:
     from .actors import Actor
 
+__all__ = [
+    "CombatStrategy",
+    "FullAttackStrategy",
+    "DefaultStrategy",
+    "DefaultDodgeStrategy",
+    "is_ally_nearby",
+    "HelpAllyStrategy",
+    "attack_action",
+    "help_action",
+    "full_dodge_action",
+    "gain_advantage_action",
+]
+
 attack_action = Attack()
 help_action = Help()
 full_dodge_action = Full_Dodge()
@@ -67,8 +80,10 @@ class DefaultDodgeStrategy(CombatStrategy):
         action_points = actor.current_action_points
         attack_count = actor.attack_count
 
-        # If this actor is targeted by enemies, the full dodge action is taken
-        if actor.targeting_enemies and not actor.is_full_dodging:
+        # If this actor is targeted by (alive) enemies, the full dodge action is taken
+        if not actor.is_full_dodging and not actor.targeting_enemies.isdisjoint(
+            enemies
+        ):
             return full_dodge_action
         # Always attack if you have not yet attacked, or if it's your last action (otherwise it is wasted)
         if (attack_count == 0) or (action_points == 1):
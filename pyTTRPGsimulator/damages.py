@@ -1,5 +1,25 @@
 from abc import ABC
 
+__all__ = [
+    "DamageType",
+    "create_damage_class",
+    "Physical",
+    "Mystical",
+    "Bludgeoning",
+    "Cold",
+    "Corrosion",
+    "Fire",
+    "Lightning",
+    "Piercing",
+    "Poison",
+    "Slashing",
+    "Psychic",
+    "Radiant",
+    "Sonic",
+    "Umbral",
+    "Damage",
+]
+
 
 class DamageType(ABC):
     """
@@ -7,6 +27,9 @@ class DamageType(ABC):
     Subclasses should implement specific types of damage.
     """
 
+    # Whether physical damage reduction applies, inherited by every damage type
+    is_physical = False
+
     def __str__(self):
         return self.__class__.__name__
 
@@ -41,6 +64,7 @@ def create_damage_class(class_name, base_class):
 # Create base damage type classes using create_damage_class
 Physical = create_damage_class("Physical", DamageType)
 Mystical = create_damage_class("Mystical", DamageType)
+Physical.is_physical = True
 
 # Create specific damage type classes by dynamically subclassing Physical and Mystical
 Bludgeoning = create_damage_class("Bludgeoning", Physical)
@@ -60,8 +84,14 @@ Umbral = create_damage_class("Umbral", Mystical)
 class Damage:
     """
     Represents damage with a specific type and value.
+
+    Damages are never modified once created, so weapons and actions share their
+    instances with every hit instead of copying them. Two damages are equal when
+    they have the same damage type class and value.
     """
 
+    __slots__ = ("damage_type", "value")
+
     def __init__(self, damage_type: DamageType, value: float):
         """
         Initialize a Damage instance.
@@ -80,6 +110,17 @@ class Damage:
         self.damage_type = damage_type
         self.value = value
 
+    def __eq__(self, other):
+        if not isinstance(other, Damage):
+            return NotImplemented
+        return (
+            type(self.damage_type) is type(other.damage_type)
+            and self.value == other.value
+        )
+
+    def __hash__(self):
+        return hash((type(self.damage_type), self.value))
+
     def __str__(self):
         return f"{self.value} {self.damage_type.__class__.__name__} damage"
 
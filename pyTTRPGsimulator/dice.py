@@ -0,0 +1,36 @@
+import random
+from typing import List
+
+__all__ = ["roll", "roll_many"]
+
+# The dice draw from the Mersenne Twister of the "random" module, looked up at each
+# roll, so random.seed() keeps simulations reproducible and patching random.random
+# (e.g., in tests) applies to the dice.
+
+
+def roll(sides: int) -> int:
+    """
+    Roll a single die.
+
+    Parameters:
+        sides (int): The number of faces of the die (e.g., 20 for a d20).
+
+    Returns:
+        int: A value between 1 and sides, both included.
+    """
+    return int(random.random() * sides) + 1
+
+
+def roll_many(sides: int, count: int) -> List[int]:
+    """
+    Roll several identical dice at once.
+
+    Parameters:
+        sides (int): The number of faces of each die.
+        count (int): The number of dice to roll.
+
+    Returns:
+        List[int]: The value of each die.
+    """
+    _random = random.random
+    return [int(_random() * sides) + 1 for _ in range(count)]
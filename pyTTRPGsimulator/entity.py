@@ -1,12 +1,30 @@
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import List, Optional, Union, Type
+from typing import Iterable, List, Optional, Union, Type, Tuple, TYPE_CHECKING
 from .modifiers import DamageModifier, Resistance, Vulnerability
 from .attributes import Attributes
 from .traits import Trait
 from dataclasses import fields, asdict
 
+if TYPE_CHECKING:
+    from .damages import DamageType
+
+__all__ = ["Entity"]
+
 
 class Entity:
+    # No per-instance __dict__ for entities that declare their own slots too
+    __slots__ = (
+        "name",
+        "base_traits",
+        "base_attributes",
+        "_cached_attributes",
+        "_cached_modifiers",
+        "_cached_damage_profiles",
+        "_bulk_edit_depth",
+        "_invalidation_pending",
+    )
+
     def __init__(
         self,
         name: str = "",
@@ -37,6 +55,13 @@ class Entity:
         self._cached_attributes = None
         self._cached_modifiers = {}
 
+        # Cache for the aggregated resistances and vulnerabilities per damage type
+        self._cached_damage_profiles = {}
+
+        # Cache invalidations deferred by bulk_edit
+        self._bulk_edit_depth = 0
+        self._invalidation_pending = False
+
         # Update attributes with any custom values provided via kwargs
         self.base_attributes = attributes if attributes is not None else Attributes()
         for key, value in kwargs.items():
@@ -45,14 +70,13 @@ class Entity:
             else:
                 raise AttributeError(f"'Attributes' object has no attribute '{key}'")
 
-        self._generate_attribute_properties()
-
-    def add_trait(self, traits: Union[Trait, List[Trait]]):
-        if isinstance(traits, list):
+    def add_trait(self, traits: Union[Trait, Iterable[Trait]]):
+        # A single trait, or any iterable of traits (list, tuple...)
+        if isinstance(traits, Trait):
+            self._add_single_trait(traits)
+        else:
             for trait in traits:
                 self._add_single_trait(trait)
-        else:
-            self._add_single_trait(traits)
         self.invalidate_cache()
 
     def _add_single_trait(self, new_trait: Trait):
@@ -67,12 +91,12 @@ class Entity:
         # If the trait is not found, add it to the list
         self.base_traits.append(new_trait)
 
-    def remove_trait(self, traits: Union[Trait, List[Trait]]):
-        if isinstance(traits, list):
+    def remove_trait(self, traits: Union[Trait, Iterable[Trait]]):
+        if isinstance(traits, Trait):
+            self._remove_single_trait(traits)
+        else:
             for trait in traits:
                 self._remove_single_trait(trait)
-        else:
-            self._remove_single_trait(traits)
         self.invalidate_cache()
 
     def _remove_single_trait(self, trait: Trait):
@@ -82,11 +106,32 @@ class Entity:
         if trait.name in [t.name for t in self.base_traits]:
             self.base_traits = [t for t in self.base_traits if t.name != trait.name]
 
+    @contextmanager
+    def bulk_edit(self):
+        """
+        Group several edits of the entity (traits, items, attributes...) so that
+        the cache is only invalidated once, when leaving the block.
+
+        Within the block, cached values may be out of date and should not be read.
+        """
+        self._bulk_edit_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_edit_depth -= 1
+            if not self._bulk_edit_depth and self._invalidation_pending:
+                self._invalidation_pending = False
+                self.invalidate_cache()
+
     def invalidate_cache(self):
         """
         Clear cached data and force recalculation of attributes and modifiers.
         """
+        if self._bulk_edit_depth:
+            self._invalidation_pending = True
+            return
         self._cached_modifiers.clear()
+        self._cached_damage_profiles.clear()
         self._cached_attributes = None
 
     def update_traits(self):
@@ -101,7 +146,7 @@ class Entity:
                 expired_traits.append(trait)
 
         if expired_traits:
-            self.invalidate_cache()
+            # Invalidates the cache once for all the expired traits
             self.remove_trait(expired_traits)
 
     def get_trait_sources(self) -> List[Trait]:
@@ -114,7 +159,9 @@ class Entity:
         """
         Returns a list of all sources of attributes for this entity.
         """
-        return [self.base_attributes] + [trait.attributes for trait in self.traits]
+        sources = [self.base_attributes]
+        sources.extend(trait.attributes for trait in self.traits)
+        return sources
 
     def aggregate_attributes(self):
         if self._cached_attributes is None:
@@ -134,7 +181,7 @@ class Entity:
 
         for trait in self.get_trait_sources():
             for modifier in trait.damage_modifiers:
-                if issubclass(type(modifier), base_class):
+                if isinstance(modifier, base_class):
                     total_modifiers.append(modifier)
         return total_modifiers
 
@@ -143,14 +190,80 @@ class Entity:
     ) -> List[DamageModifier]:
         """
         Retrieve cached modifiers of a specific class, populating cache if necessary.
+
+        The first call after an invalidation sorts all the modifiers of the entity
+        in one pass: each modifier is listed under its class and every parent class
+        up to DamageModifier, so Resistance and Vulnerability come for free.
         """
-        if (modifier_class not in self._cached_modifiers) or (
-            self._cached_modifiers is None
-        ):
-            self._cached_modifiers[modifier_class] = self.aggregate_modifiers(
-                modifier_class
+        cached_modifiers = self._cached_modifiers
+        if not cached_modifiers:
+            cached_modifiers[DamageModifier] = []
+            for trait in self.get_trait_sources():
+                for modifier in trait.damage_modifiers:
+                    for cls in type(modifier).__mro__:
+                        cached_modifiers.setdefault(cls, []).append(modifier)
+                        if cls is DamageModifier:
+                            break
+
+        modifiers = cached_modifiers.get(modifier_class)
+        if modifiers is None:
+            # Not a class of any of the modifiers (or not a DamageModifier at all)
+            modifiers = self.aggregate_modifiers(modifier_class)
+            cached_modifiers[modifier_class] = modifiers
+        return modifiers
+
+    def calculate_damage_profile(
+        self, damage_type: Type["DamageType"]
+    ) -> Tuple[float, float, float, float, int]:
+        """
+        Retrieve the cached resistances, vulnerabilities and damage reduction of
+        this entity against a type of damage, populating cache if necessary.
+
+        A resistance or vulnerability applies if its damage type is an instance of
+        the given damage type class.
+
+        Returns:
+            Tuple[float, float, float, float, int]: The additive resistance, the
+                multiplicative resistance, the additive vulnerability, the
+                multiplicative vulnerability and the (physical or mystical) damage
+                reduction.
+        """
+        profile = self._cached_damage_profiles.get(damage_type)
+        if profile is None:
+            additive_resistance = 0
+            multiplicative_resistance = 1
+            for res in self.resistances:
+                if isinstance(res.damage_type, damage_type):
+                    if res.is_multiplicative:
+                        multiplicative_resistance *= res.value
+                    else:
+                        additive_resistance += res.value
+
+            additive_vulnerability = 0
+            multiplicative_vulnerability = 1
+            for vul in self.vulnerabilities:
+                if isinstance(vul.damage_type, damage_type):
+                    if vul.is_multiplicative:
+                        multiplicative_vulnerability *= vul.value
+                    else:
+                        additive_vulnerability += vul.value
+
+            attributes = self.attributes
+            damage_reduction = (
+                attributes.physical_damage_reduction
+                if damage_type.is_physical
+                else attributes.mystical_damage_reduction
+            )
+
+            profile = (
+                additive_resistance,
+                multiplicative_resistance,
+                additive_vulnerability,
+                multiplicative_vulnerability,
+                damage_reduction,
             )
-        return self._cached_modifiers[modifier_class]
+            self._cached_damage_profiles[damage_type] = profile
+        return profile
 
     @property
     def attributes(self) -> "Attributes":
@@ -172,27 +285,6 @@ class Entity:
     def vulnerabilities(self) -> List["Vulnerability"]:
         return self.calculate_modifiers(Vulnerability)
 
-    def _generate_attribute_properties(self):
-        """
-        Dynamically generate properties for each attribute in the Attributes class.
-        """
-        for field in self.base_attributes.__dataclass_fields__:
-            # Define a getter function for the attribute
-            def get_attr(self, key=field):
-                return getattr(self.aggregate_attributes(), key)
-
-            # Define a setter function for the attribute
-            def set_attr(self, value, key=field):
-                setattr(self.base_attributes, key, value)
-                self.invalidate_cache()  # Invalidate cache when an attribute is set
-
-            # Attach the property to the instance
-            setattr(
-                self.__class__,
-                field,
-                property(get_attr, set_attr),
-            )
-
     def __str__(self):
         non_standard_attributes = {}
         default_attributes = asdict(
@@ -212,3 +304,25 @@ class Entity:
         )
 
         return f"{self.name}: {attributes_str if attributes_str else 'No non-standard attributes'}"
+
+
+def _attribute_property(key: str) -> property:
+    """
+    Create the property giving access to an attribute: it reads the aggregated
+    attributes and writes the base attributes.
+    """
+
+    def get_attr(self):
+        return getattr(self.aggregate_attributes(), key)
+
+    def set_attr(self, value):
+        setattr(self.base_attributes, key, value)
+        self.invalidate_cache()  # Invalidate cache when an attribute is set
+
+    return property(get_attr, set_attr)
+
+
+# Generate the attribute properties once, they are inherited by every entity
+for _field in fields(Attributes):
+    setattr(Entity, _field.name, _attribute_property(_field.name))
+del _field
@@ -1,11 +1,46 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from .damages import Damage
 from .modifiers import DamageModifier, Resistance, Vulnerability
-from .weapon_styles import *
+from .weapon_styles import (
+    WeaponStyle,
+    Axe_style,
+    Bow_style,
+    Chained_style,
+    Crossbow_style,
+    Fist_style,
+    Hammer_style,
+    Pick_style,
+    Spear_style,
+    Staff_style,
+    Sword_style,
+    Whip_style,
+)
 from .entity import Entity
 from .traits import Trait
 from .attributes import Attributes
 
+__all__ = [
+    "Item",
+    "ItemManager",
+    "Armor",
+    "Shield",
+    "Weapon",
+    "MeleeWeapon",
+    "RangeWeapon",
+    "create_weapon_class",
+    "Axe",
+    "Sword",
+    "Bow",
+    "Chained",
+    "Crossbow",
+    "Fist",
+    "Hammer",
+    "Pick",
+    "Spear",
+    "Staff",
+    "Whip",
+]
+
 
 class Item(Entity):
     def __init__(
@@ -61,63 +96,83 @@ class Item(Entity):
 
 class ItemManager:
     def __init__(self):
-        self.items: List[Item] = []
+        # Rebuilt on every change, so it can be handed out without copying
+        self._items: Tuple[Item, ...] = ()
+
+        # Cache of the items of each requested type, reset when items change
+        self._cached_items_of_type: Dict[type, Tuple[Item, ...]] = {}
+
+    @property
+    def items(self) -> Tuple[Item, ...]:
+        """The managed items, read-only: use add_item and remove_item to change them."""
+        return self._items
 
     def add_item(self, item: Union[Item, List[Item]]):
+        self._cached_items_of_type.clear()
         if isinstance(item, list):
             for i in item:
-                if i not in self.items:
-                    self.items.append(i)
+                if i not in self._items:
+                    self._items += (i,)
         else:
-            if item not in self.items:
-                self.items.append(item)
+            if item not in self._items:
+                self._items += (item,)
 
     def remove_item(self, item: Union[Item, List[Item]]):
+        self._cached_items_of_type.clear()
         if isinstance(item, list):
-            for i in item:
-                if i in self.items:
-                    self.items.remove(i)
+            self._items = tuple(i for i in self._items if i not in item)
         else:
-            if item in self.items:
-                self.items.remove(item)
+            self._items = tuple(i for i in self._items if i is not item)
 
-    def get_items(self) -> List[Item]:
+    def get_items(self) -> Tuple[Item, ...]:
         return self.items
 
-    def get_items_of_type(self, item_type: type) -> List[Item]:
-        return [item for item in self.items if isinstance(item, item_type)]
+    def get_items_of_type(self, item_type: type) -> Tuple[Item, ...]:
+        """
+        Retrieve the items of a given type, populating cache if necessary.
+        """
+        items_of_type = self._cached_items_of_type.get(item_type)
+        if items_of_type is None:
+            items_of_type = tuple(
+                item for item in self._items if isinstance(item, item_type)
+            )
+            self._cached_items_of_type[item_type] = items_of_type
+        return items_of_type
 
 
 class Armor(Item):
 
     def __repr__(self):
+        attributes = self.attributes
         return (
-            f"Armor(name={self.name}, physical_defense={self.attributes.physical_defense}, "
-            f"mystical_defense={self.attributes.mystical_defense}, "
-            f"physical_damage_reduction={self.attributes.physical_damage_reduction}, "
-            f"mystical_damage_reduction={self.attributes.mystical_damage_reduction}, "
+            f"Armor(name={self.name}, physical_defense={attributes.physical_defense}, "
+            f"mystical_defense={attributes.mystical_defense}, "
+            f"physical_damage_reduction={attributes.physical_damage_reduction}, "
+            f"mystical_damage_reduction={attributes.mystical_damage_reduction}, "
             f"modifiers={self.damage_modifiers})"
         )
 
     def __str__(self) -> str:
         base_str = super().__str__()
+        attributes = self.attributes
         return (
             f"{base_str}\n"
-            f"Physical Defense: {self.attributes.physical_defense}\n"
-            f"Mystical Defense: {self.attributes.mystical_defense}\n"
-            f"Physical Damage Reduction: {self.attributes.physical_damage_reduction}\n"
-            f"Mystical Damage Reduction: {self.attributes.mystical_damage_reduction}"
+            f"Physical Defense: {attributes.physical_defense}\n"
+            f"Mystical Defense: {attributes.mystical_defense}\n"
+            f"Physical Damage Reduction: {attributes.physical_damage_reduction}\n"
+            f"Mystical Damage Reduction: {attributes.mystical_damage_reduction}"
         )
 
 
 class Shield(Armor):
 
     def __repr__(self):
+        attributes = self.attributes
         return (
-            f"Shield(name={self.name}, physical_defense={self.attributes.physical_defense}, "
-            f"mystical_defense={self.attributes.mystical_defense}, "
-            f"physical_damage_reduction={self.attributes.physical_damage_reduction}, "
-            f"mystical_damage_reduction={self.attributes.mystical_damage_reduction}, "
+            f"Shield(name={self.name}, physical_defense={attributes.physical_defense}, "
+            f"mystical_defense={attributes.mystical_defense}, "
+            f"physical_damage_reduction={attributes.physical_damage_reduction}, "
+            f"mystical_damage_reduction={attributes.mystical_damage_reduction}, "
             f"modifiers={self.damage_modifiers})"
         )
 
@@ -143,7 +198,6 @@ class Weapon(Item):
             self.damages = damages
         else:
             raise TypeError("Expected a Damage instance or a list of Damage instances.")
-            print(damages)
 
         self.weapon_range = weapon_range
         self.weapon_styles = weapon_styles if weapon_styles is not None else []
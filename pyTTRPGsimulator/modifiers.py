@@ -7,6 +7,8 @@ from .damages import DamageType
 if TYPE_CHECKING:
     from .actors import Actor
 
+__all__ = ["DamageModifier", "Resistance", "Vulnerability", "ModifierManager"]
+
 
 class DamageModifier:
     """Modifier to adjust damage values."""
@@ -5,11 +5,12 @@ from .actions import Action
 from .traits import Trait
 from .damages import Damage
 
-
 if TYPE_CHECKING:
     from .actions import Action
     from .actors import Actor
 
+__all__ = ["Spell", "CastSpell"]
+
 
 class Spell:
     def __init__(
@@ -73,13 +74,21 @@ class CastSpell(Action):
     TODO : could probably improve inheritance pattern
     """
 
+    __slots__ = ()
+
     def __init__(self):
-        return
+        # The costs are those of the spell being cast, set at each execution
+        super().__init__()
 
     def execute(self, source: "Actor", targets: "Actor", spell: "Spell"):
-        self.action_points_cost = spell.action_points_cost
-        self.mana_points_cost = spell.mana_points_cost
-        self.stamina_points_cost = spell.stamina_points_cost
+        # Only rebuild the cost check when the spell costs differ from the last one
+        costs = (
+            spell.action_points_cost,
+            spell.mana_points_cost,
+            spell.stamina_points_cost,
+        )
+        if costs != self._costs:
+            self._set_costs(*costs)
 
         if not self._apply_costs(source):
             return
@@ -90,10 +99,10 @@ class CastSpell(Action):
             spell_copy.targets = targets
             source.add_concentration(spell_copy)
 
-        # Apply all traits on all targets
-        for trait in spell.traits:
+        # Apply all traits on all targets, at once for each target
+        if spell.traits:
             for target in targets:
-                target.add_trait(trait)
+                target.add_trait(spell.traits)
 
         # Save-related traits
         if (
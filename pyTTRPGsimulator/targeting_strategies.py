@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
+from operator import attrgetter
 from typing import List, Optional, TYPE_CHECKING
 import random
 from .actions import MoveToTarget, Target
 
+__all__ = [
+    "TargetingStrategy",
+    "TargetWeakestStrategy",
+    "TargetHealthiestStrategy",
+    "RandomTargetStrategy",
+    "move_to_target_action",
+    "target_action",
+]
+
 move_to_target_action = MoveToTarget()
 target_action = Target()
 
+# Sort key of the weakest / healthiest targets, evaluated in C by min and max
+_health_points = attrgetter("current_health_points")
+
 if TYPE_CHECKING:
     from .actors import Actor
 
@@ -28,7 +41,10 @@ class TargetWeakestStrategy(TargetingStrategy):
     ) -> Optional["Actor"]:
 
         # Favor enemies targeting actor
-        candidates = [enemy for enemy in enemies if enemy.current_target == actor]
+        targeted_by = actor.targeted_by
+        candidates = (
+            [enemy for enemy in enemies if enemy in targeted_by] if targeted_by else []
+        )
 
         if actor.current_target in enemies and actor.current_target.is_alive:
             candidates.append(actor.current_target)
@@ -43,7 +59,7 @@ class TargetWeakestStrategy(TargetingStrategy):
             action = target_action
 
         # Execute the action
-        target = min(candidates, key=lambda enemy: enemy.current_health_points)
+        target = min(candidates, key=_health_points)
 
         # If already targeting the correct target, do nothing
         if target == actor.current_target:
@@ -59,7 +75,10 @@ class TargetHealthiestStrategy(TargetingStrategy):
     ) -> Optional["Actor"]:
 
         # Favor enemies targeting actor
-        candidates = [enemy for enemy in enemies if enemy.current_target == actor]
+        targeted_by = actor.targeted_by
+        candidates = (
+            [enemy for enemy in enemies if enemy in targeted_by] if targeted_by else []
+        )
 
         if actor.current_target in enemies and actor.current_target.is_alive:
             candidates.append(actor.current_target)
@@ -74,7 +93,7 @@ class TargetHealthiestStrategy(TargetingStrategy):
             action = target_action
 
         # Execute the action
-        target = max(candidates, key=lambda enemy: enemy.current_health_points)
+        target = max(candidates, key=_health_points)
 
         # If already targeting the correct target, do nothing
         if target is actor.current_target:
@@ -90,7 +109,10 @@ class RandomTargetStrategy(TargetingStrategy):
     ) -> Optional["Actor"]:
 
         # Favor enemies targeting actor
-        candidates = [enemy for enemy in enemies if enemy.current_target == actor]
+        targeted_by = actor.targeted_by
+        candidates = (
+            [enemy for enemy in enemies if enemy in targeted_by] if targeted_by else []
+        )
 
         if actor.current_target in enemies and actor.current_target.is_alive:
             candidates.append(actor.current_target)
@@ -8,6 +8,8 @@ from .modifiers import DamageModifier
 if TYPE_CHECKING:
     from .entity import Entity
 
+__all__ = ["Trait", "TraitsManager"]
+
 
 class Trait:
     def __init__(
@@ -1,5 +1,20 @@
 from abc import ABC, abstractmethod
 
+__all__ = [
+    "WeaponStyle",
+    "Axe_style",
+    "Bow_style",
+    "Chained_style",
+    "Crossbow_style",
+    "Fist_style",
+    "Hammer_style",
+    "Pick_style",
+    "Spear_style",
+    "Staff_style",
+    "Sword_style",
+    "Whip_style",
+]
+
 
 class WeaponStyle(ABC):
     @abstractmethod
@@ -0,0 +1,136 @@
+"""
+Checks of the actions. Run with `python -m pytest tests`.
+"""
+
+import pytest
+
+from context import pyTTRPGsimulator as rpg
+from pyTTRPGsimulator import actions
+from pyTTRPGsimulator.actions import _hit_damage_bonus
+
+
+def make_weapon(**kwargs):
+    return rpg.MeleeWeapon(
+        damages=[rpg.Damage(damage_type=rpg.Slashing(), value=1)], **kwargs
+    )
+
+
+def test_impose_trait_accepts_any_iterable_of_traits():
+    source, target = rpg.Actor(name="A"), rpg.Actor(name="B")
+    might = target.might
+    traits = (rpg.Trait(name="Strong", might=1), rpg.Trait(name="Stronger", might=2))
+
+    rpg.ImposeTrait(traits=traits).execute(source, [target])
+
+    assert [trait.name for trait in target.traits] == ["Strong", "Stronger"]
+    assert target.might == might + 3
+
+    target.remove_trait(traits)
+    assert target.traits == []
+
+
+def test_saving_throw_outcomes_are_tuples_of_actions():
+    dodge = rpg.Dodge(action_points_cost=0)
+    save = rpg.ImposeSavingThrow("might", 10, on_success=[], on_failure=[dodge])
+    assert save.on_success == ()
+    assert save.on_failure == (dodge,)
+
+    with pytest.raises(TypeError):
+        rpg.ImposeSavingThrow(
+            "might", 10, on_success=[], on_failure=[rpg.Trait(name="Burning")]
+        )
+
+
+def test_hit_damage_bonus_flags_heavy_hits():
+    # hit, heavy hit, brutal hit and critical hit bonuses
+    bonuses = (1, 10, 100, 1000)
+
+    assert _hit_damage_bonus(4, False, *bonuses) == (False, 0, 1)
+    assert _hit_damage_bonus(5, False, *bonuses) == (True, 0, 11)
+    assert _hit_damage_bonus(12, False, *bonuses) == (True, 1, 111)
+    assert _hit_damage_bonus(-3, True, *bonuses) == (False, 0, 1001)
+
+
+def test_saving_throw_is_resolved_per_target():
+    source = rpg.Actor(name="A")
+    targets = [rpg.Actor(name="B"), rpg.Actor(name="C")]
+    action_points = source.current_action_points
+
+    # Nobody can succeed, so the failure action is paid once per target
+    save = rpg.ImposeSavingThrow(
+        "might", 100, on_success=[], on_failure=[rpg.Dodge(action_points_cost=1)]
+    )
+    save.execute(source, targets)
+
+    assert source.current_action_points == action_points - 2
+
+
+def test_advantage_keeps_highest_roll_and_is_spent(monkeypatch):
+    source = rpg.Actor(name="A")
+    source.add_item(make_weapon())
+    target = rpg.Actor(name="B")
+    rolls = []
+
+    def roll_many(dice, number):
+        rolls.append((dice, number))
+        return [2, 15][:number]
+
+    monkeypatch.setattr(actions, "roll_many", roll_many)
+    monkeypatch.setattr(actions, "roll", lambda dice: 1)
+
+    source.advantage_count = 1
+    health_points = target.current_health_points
+    rpg.Attack(action_points_cost=0).execute(source, target)
+
+    # A 2 would miss, the 15 hits
+    assert rolls == [(20, 2)]
+    assert target.current_health_points < health_points
+    assert source.advantage_count == 0
+
+
+def test_costs_are_paid_only_when_affordable():
+    actor = rpg.Actor(name="A")
+    actor.current_action_points, actor.current_mana_points = 2, 1
+
+    # Only action points, then all the points, then a cost that cannot be paid
+    rpg.Dodge(action_points_cost=1).execute(actor)
+    rpg.Dodge(action_points_cost=1, mana_points_cost=1).execute(actor)
+    assert (actor.current_action_points, actor.current_mana_points) == (0, 0)
+
+    actor.is_dodging = False
+    actor.current_action_points = 1
+    rpg.Dodge(action_points_cost=1, stamina_points_cost=1).execute(actor)
+    assert not actor.is_dodging
+    assert actor.current_action_points == 1
+
+    # Free actions are always performed, and changing a cost is taken into account
+    dodge = rpg.Dodge(action_points_cost=0)
+    dodge.execute(actor)
+    assert actor.is_dodging and actor.current_action_points == 1
+    dodge.action_points_cost = 2
+    actor.is_dodging = False
+    dodge.execute(actor)
+    assert not actor.is_dodging
+
+
+def test_inflict_damage_takes_all_damages_at_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        rpg.Actor, "take_damage", lambda self, damages: calls.append((self, damages))
+    )
+    source, targets = rpg.Actor(name="A"), [rpg.Actor(name="B"), rpg.Actor(name="C")]
+    damages = [rpg.Damage(rpg.Fire(), 2), rpg.Damage(rpg.Cold(), 1)]
+
+    rpg.InflictDamage(damages=damages).execute(source, targets)
+
+    assert calls == [(targets[0], damages), (targets[1], damages)]
+
+
+def test_dodge_acts_on_its_source():
+    source, target = rpg.Actor(name="A"), rpg.Actor(name="B")
+
+    rpg.Dodge().execute(source, target)
+    assert source.is_dodging and not target.is_dodging
+
+    rpg.Full_Dodge().execute(source, target)
+    assert source.is_full_dodging and not target.is_full_dodging
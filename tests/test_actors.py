@@ -0,0 +1,116 @@
+"""
+Checks of the Actor class. Run with `python -m pytest tests`.
+"""
+
+import pytest
+
+from context import pyTTRPGsimulator as rpg
+
+
+def test_targeting_enemies_follows_current_target():
+    actor, ally, enemy = rpg.Actor(name="A"), rpg.Actor(name="B"), rpg.Actor(name="C")
+    actor.is_team_A = ally.is_team_A = True
+    enemy.is_team_A = False
+
+    enemy.current_target = actor
+    ally.current_target = actor
+    assert actor.targeted_by == {enemy, ally}
+    assert actor.targeting_enemies == {enemy}
+
+    enemy.current_target = ally
+    assert actor.targeting_enemies == set()
+    assert ally.targeting_enemies == {enemy}
+
+
+def test_dodge_strategy_full_dodges_when_targeted_by_alive_enemies():
+    actor, enemy = rpg.Actor(name="A"), rpg.Actor(name="B")
+    actor.is_team_A, enemy.is_team_A = True, False
+    strategy = rpg.DefaultDodgeStrategy()
+
+    assert strategy.choose_action(actor, [], [enemy]) is not rpg.full_dodge_action
+
+    enemy.current_target = actor
+    assert strategy.choose_action(actor, [], [enemy]) is rpg.full_dodge_action
+
+    # A dead enemy is no longer in the enemies handed to the strategy
+    assert strategy.choose_action(actor, [], []) is not rpg.full_dodge_action
+
+
+def test_bulk_edit_updates_attributes_when_leaving_the_block():
+    actor = rpg.Actor(name="A", might=1)
+    assert actor.might == 1
+
+    with actor.bulk_edit():
+        with actor.bulk_edit():
+            actor.add_trait(rpg.Trait(name="Strong", might=2))
+        actor.add_trait(rpg.Trait(name="Stronger", might=1))
+    assert actor.might == 4
+
+    # The edits made before an error are still taken into account
+    with pytest.raises(RuntimeError):
+        with actor.bulk_edit():
+            actor.add_trait(rpg.Trait(name="Strongest", might=1))
+            raise RuntimeError
+    assert actor.might == 5
+
+
+def test_attributes_follow_traits_and_items():
+    actor = rpg.Actor(name="A", physical_defense=8)
+    assert actor.physical_defense == 8
+
+    trait = rpg.Trait(name="Shielded", physical_defense=1)
+    actor.add_trait(trait)
+    assert actor.physical_defense == 9
+
+    armor = rpg.Armor(physical_defense=2)
+    actor.add_item(armor)
+    assert actor.physical_defense == 11
+
+    actor.remove_trait(trait)
+    actor.remove_item(armor)
+    assert actor.physical_defense == 8
+
+
+def test_targeted_by_follows_retargeting():
+    actor, first, second = rpg.Actor(name="A"), rpg.Actor(name="B"), rpg.Actor(name="C")
+
+    actor.current_target = first
+    assert first.targeted_by == {actor}
+
+    actor.current_target = second
+    assert first.targeted_by == set()
+    assert second.targeted_by == {actor}
+
+    actor.current_target = None
+    assert second.targeted_by == set()
+
+
+def test_targeting_ignores_dead_attackers():
+    actor = rpg.Actor(name="A")
+    dead, alive, other = rpg.Actor(name="B"), rpg.Actor(name="C"), rpg.Actor(name="D")
+    dead.current_target = actor
+    alive.current_target = actor
+    dead.current_health_points = 0
+    other.current_health_points = 1
+
+    # Combat only hands alive enemies to the targeting strategies
+    enemies = [enemy for enemy in (dead, alive, other) if enemy.is_alive]
+    rpg.TargetWeakestStrategy().select_target(actor, [], enemies)
+
+    assert actor.current_target is alive
+    assert alive in actor.targeted_by
+
+
+def test_damage_profile_follows_traits():
+    actor = rpg.Actor(name="A")
+    add_res = actor.calculate_damage_profile(rpg.Fire)[0]
+    assert add_res == 0
+
+    actor.add_trait(
+        rpg.Trait(
+            name="Fire resistance",
+            damage_modifiers=rpg.Resistance(damage_type=rpg.Fire(), value=1),
+        )
+    )
+    assert actor.calculate_damage_profile(rpg.Fire)[0] == 1
+    assert actor.calculate_damage_profile(rpg.Cold)[0] == 0
@@ -0,0 +1,27 @@
+"""
+Checks of the damages. Run with `python -m pytest tests`.
+"""
+
+import pytest
+
+from context import pyTTRPGsimulator as rpg
+
+
+def test_damages_compare_by_damage_type_class_and_value():
+    fire = rpg.Damage(damage_type=rpg.Fire(), value=3)
+
+    assert fire == rpg.Damage(rpg.Fire(), 3)
+    assert hash(fire) == hash(rpg.Damage(rpg.Fire(), 3))
+    assert fire != rpg.Damage(rpg.Cold(), 3)
+    assert fire != rpg.Damage(rpg.Fire(), 4)
+    assert len({fire, rpg.Damage(rpg.Fire(), 3), rpg.Damage(rpg.Cold(), 3)}) == 2
+
+
+def test_damage_is_not_a_sequence():
+    fire = rpg.Damage(damage_type=rpg.Fire(), value=3)
+
+    with pytest.raises(TypeError):
+        iter(fire)
+    with pytest.raises(TypeError):
+        rpg.Damage(damage_type=rpg.Fire, value=3)
+    assert not hasattr(rpg, "make_damage")
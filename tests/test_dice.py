@@ -0,0 +1,27 @@
+"""
+Checks of the dice helpers. Run with `python -m pytest tests`.
+"""
+
+import random
+
+from context import pyTTRPGsimulator as rpg
+from pyTTRPGsimulator.dice import roll, roll_many
+
+
+def test_dice_follow_random_seed():
+    random.seed(3)
+    first = [roll(20)] + roll_many(6, 3)
+    random.seed(3)
+    assert [roll(20)] + roll_many(6, 3) == first
+    assert 1 <= first[0] <= 20 and all(1 <= value <= 6 for value in first[1:])
+
+
+def test_dice_follow_patched_random(monkeypatch):
+    monkeypatch.setattr(random, "random", lambda: 0.99)
+    assert roll(20) == 20
+    assert roll_many(4, 2) == [4, 4]
+
+
+def test_dice_are_not_exported_by_the_package():
+    assert not hasattr(rpg, "roll")
+    assert not hasattr(rpg, "roll_many")
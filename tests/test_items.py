@@ -0,0 +1,53 @@
+"""
+Checks of the items and of the item manager. Run with `python -m pytest tests`.
+"""
+
+import pytest
+
+from context import pyTTRPGsimulator as rpg
+
+
+class Bonus_style(rpg.WeaponStyle):
+    def apply_effect(self, defender):
+        return 1, 2
+
+
+def make_weapon(**kwargs):
+    return rpg.MeleeWeapon(
+        damages=[rpg.Damage(damage_type=rpg.Slashing(), value=1)], **kwargs
+    )
+
+
+def test_items_of_type_follow_added_and_removed_items():
+    actor = rpg.Actor(name="A")
+    assert actor.weapons == ()
+
+    weapon, armor = make_weapon(), rpg.Armor(physical_defense=2)
+    actor.add_item([weapon, armor])
+    assert actor.weapons == (weapon,)
+    assert actor.armors == (armor,)
+    assert actor.items == (weapon, armor)
+
+    actor.remove_item(weapon)
+    assert actor.weapons == ()
+    assert actor.items == (armor,)
+
+
+def test_items_are_read_only():
+    manager = rpg.ItemManager()
+    manager.add_item(make_weapon())
+
+    with pytest.raises(AttributeError):
+        manager.items = []
+    with pytest.raises(AttributeError):
+        manager.get_items_of_type(rpg.Weapon).append(make_weapon())
+    assert len(manager.get_items_of_type(rpg.Weapon)) == 1
+
+
+def test_weapon_styles_changes_are_seen():
+    defender = rpg.Actor(name="D")
+    weapon = make_weapon(weapon_styles=[Bonus_style])
+    assert weapon.apply_styles(defender) == (1, 2)
+
+    weapon.weapon_styles = []
+    assert weapon.apply_styles(defender) == (0, 0)
@@ -0,0 +1,33 @@
+"""
+Checks of the logging setup. Run with `python -m pytest tests`.
+"""
+
+import logging
+
+from context import pyTTRPGsimulator as rpg
+
+
+def test_setup_logging_switches_file_and_level(tmp_path, monkeypatch):
+    # Start from an unconfigured logger, hidden from the handlers of pytest
+    logger = logging.getLogger("pyTTRPGsimulator")
+    monkeypatch.setattr(rpg, "_logger", None)
+    monkeypatch.setattr(logger, "handlers", [])
+    monkeypatch.setattr(logger, "propagate", False)
+    first, second = tmp_path / "first.log", tmp_path / "second.log"
+
+    try:
+        assert rpg.setup_logging(logging.INFO, log_filename=str(first)) is logger
+        assert "Welcome" in first.read_text()
+
+        assert rpg.setup_logging(logging.WARNING, log_filename=str(second)) is logger
+        logger.info("muted")
+        logger.warning("second")
+
+        assert logger.level == logging.WARNING
+        assert "muted" not in first.read_text() + second.read_text()
+        assert "second" not in first.read_text()
+        # The banner is only logged by the first call
+        assert second.read_text() == "second\n"
+    finally:
+        for handler in logger.handlers:
+            handler.close()